@@ -272,6 +272,24 @@ rm -f mediaboxconfig.php > /dev/null 2>&1
 rm -f settings.ini.php > /dev/null 2>&1
 rm -f prep/mediaboxconfig.php > /dev/null 2>&1
 
+# Pass the host GPU render devices to Plex for hardware transcoding (if present)
+# Only create or refresh the override file if it is one Mediabox generated
+if [ -d /dev/dri ] && { [ ! -f docker-compose.override.yml ] || grep -q "MEDIABOX HWACCEL" docker-compose.override.yml; }; then
+    printf "GPU render device found - enabling Plex hardware transcoding.\\n\\n"
+    cat << EOF > docker-compose.override.yml
+## MEDIABOX HWACCEL - generated by mediabox.sh
+## Passes /dev/dri through to Plex for hardware transcoding
+version: '3.5'
+
+services:
+  plex:
+    devices:
+        - '/dev/dri:/dev/dri'
+EOF
+elif [ ! -d /dev/dri ] && [ -f docker-compose.override.yml ] && grep -q "MEDIABOX HWACCEL" docker-compose.override.yml; then
+    rm -f docker-compose.override.yml > /dev/null 2>&1
+fi
+
 # Download & Launch the containers
 echo "The containers will now be pulled and launched"
 echo "This may take a while depending on your download speed"